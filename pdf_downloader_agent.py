@@ -1,5 +1,25 @@
+import json
+import logging
 import os
+import re
+import shutil
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
+
+import lxml.html
+import urllib3
+
+# Optional disk-backed HTTP cache; page fetches fall back to the plain
+# connection pool when it isn't installed
+try:
+    import requests
+    from cachecontrol import CacheControl
+    from cachecontrol.caches.file_cache import FileCache
+except ImportError:
+    CacheControl = None
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -7,26 +27,126 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
+
+logger = logging.getLogger(__name__)
+
+
+def _canonicalize_url(url, base=None):
+    """
+    Normalize a PDF URL so duplicates compare equal
+
+    Resolves relative paths against the page URL, lowercases the scheme
+    and host, and strips the fragment.
+
+    Args:
+        url (str): URL to normalize
+        base (str, optional): Page URL to resolve relative paths against
+
+    Returns:
+        str: The normalized absolute URL
+    """
+    if base:
+        url = urljoin(base, url)
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ''))
+
+
+# Matches the PDF URL in onclick handlers like window.open('x.pdf') or
+# location.href = 'x.PDF?year=2024'
+_ONCLICK_PDF_RE = re.compile(
+    r"(?:window\.open\s*\(|location\.href\s*=\s*)['\"]([^'\"]+?\.pdf[^'\"]*)['\"]",
+    re.IGNORECASE
+)
+
+_CHROMEDRIVER_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "pdf-downloader", "chromedriver_path")
+_CHROMEDRIVER_CACHE_TTL = 7 * 24 * 60 * 60  # re-check for driver updates weekly
+
+
+def _resolve_chromedriver():
+    """
+    Resolve the chromedriver executable path
+
+    ChromeDriverManager().install() checks the network for a newer driver
+    on every call, so the resolved path is cached on disk and reused for
+    a week before the version check runs again.
+
+    Returns:
+        str: Path to the chromedriver executable
+    """
+    try:
+        if time.time() - os.path.getmtime(_CHROMEDRIVER_CACHE) < _CHROMEDRIVER_CACHE_TTL:
+            with open(_CHROMEDRIVER_CACHE) as f:
+                cached_path = f.read().strip()
+            if cached_path and os.access(cached_path, os.X_OK):
+                return cached_path
+    except OSError:
+        pass
+
+    driver_path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(_CHROMEDRIVER_CACHE), exist_ok=True)
+        with open(_CHROMEDRIVER_CACHE, 'w') as f:
+            f.write(driver_path)
+    except OSError as e:
+        logger.warning("Could not cache chromedriver path: %s", e)
+    return driver_path
+
 
 class PDFDownloaderAgent:
-    def __init__(self, download_folder):
+    def __init__(self, download_folder, headful=False):
         """
         Initialize the PDF Downloader Agent
-        
+
         Args:
             download_folder (str): Path to the folder where PDFs will be saved
+            headful (bool): Run Chrome with a visible window. Headless can
+                be served different content by some sites; pass True if the
+                page breaks without a real window.
         """
         self.download_folder = os.path.abspath(download_folder)
         self.download_counter = 0
-        self.driver = None
-        
+        self.headful = headful
+        self._driver = None
+
+        # Pooled HTTP client so all PDF downloads reuse one TCP+TLS connection
+        self.http = urllib3.PoolManager(maxsize=16)
+
+        # Cache listing-page responses on disk so re-runs against an
+        # unchanged page are served locally (honors ETag/Cache-Control)
+        self._cached_session = None
+        if CacheControl is not None:
+            try:
+                self._cached_session = CacheControl(requests.Session(), cache=FileCache('.webcache'))
+            except ImportError:
+                # FileCache needs the cachecontrol[filecache] extra
+                pass
+
         # Create download folder if it doesn't exist
         os.makedirs(self.download_folder, exist_ok=True)
-        
-        # Setup Chrome options
-        self._setup_browser()
-        
+
+        # Prefix for building paths inside the download folder without
+        # re-parsing separators on every join
+        self._dl = self.download_folder + os.sep
+
+        # Manifest of completed downloads, keyed by URL, so re-runs can
+        # skip files that are already on disk
+        self._manifest_path = os.path.join(self.download_folder, ".manifest.json")
+        self._manifest = self._load_manifest()
+        self._manifest_lock = threading.Lock()
+
+    @property
+    def driver(self):
+        """
+        The Selenium driver, started on first access
+
+        Static link discovery never touches this, so runs against plain
+        HTML pages skip browser startup entirely.
+        """
+        if self._driver is None:
+            self._setup_browser()
+        return self._driver
+
     def _setup_browser(self):
         """
         Configure and initialize the Chrome browser
@@ -35,36 +155,43 @@ class PDFDownloaderAgent:
         
         # Add general options for stability
         chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
+        if os.path.exists('/.dockerenv'):
+            # /dev/shm is tiny inside containers; outside them the flag
+            # only slows Chrome down
+            chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-extensions")
-        
-        # Set download preferences
+
+        # The browser only needs to parse anchors, so skip rendering work
+        # unless the caller asked for a visible window
+        if not self.headful:
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+
+        # The browser only discovers links, so the prefs just block
+        # content it never needs to load
         prefs = {
-            "download.default_directory": self.download_folder,
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "plugins.always_open_pdf_externally": True,  # Ensure PDFs are downloaded, not opened
-            "safebrowsing.enabled": False  # Disable safe browsing to avoid download warnings
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
         }
         chrome_options.add_experimental_option("prefs", prefs)
-        
-        # Disable the "Save As" dialog for downloads
+
+        # Hide the automation infobar
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         
         try:
-            # Initialize the Chrome driver with the ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.maximize_window()
+            # Initialize the Chrome driver with the cached chromedriver path
+            service = Service(_resolve_chromedriver())
+            self._driver = webdriver.Chrome(service=service, options=chrome_options)
+            if self.headful:
+                self._driver.maximize_window()
         except Exception as e:
-            print(f"Error setting up Chrome driver with ChromeDriverManager: {e}")
-            print("Falling back to default Chrome driver...")
+            logger.error("Error setting up Chrome driver with ChromeDriverManager: %s", e)
+            logger.info("Falling back to default Chrome driver...")
             try:
                 # Try with default ChromeDriver
-                self.driver = webdriver.Chrome(options=chrome_options)
+                self._driver = webdriver.Chrome(options=chrome_options)
             except Exception as e2:
-                print(f"Error with default Chrome driver: {e2}")
+                logger.error("Error with default Chrome driver: %s", e2)
                 raise Exception("Could not initialize Chrome driver")
         
     def navigate_to_url(self, url):
@@ -74,216 +201,355 @@ class PDFDownloaderAgent:
         Args:
             url (str): URL to navigate to
         """
-        print(f"Navigating to {url}")
+        logger.info("Navigating to %s", url)
         try:
             self.driver.get(url)
             # Wait for the page to load
             WebDriverWait(self.driver, 20).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
-            print("Page loaded successfully")
+            logger.info("Page loaded successfully")
         except TimeoutException:
-            print("Page load timed out, but continuing anyway")
+            logger.warning("Page load timed out, but continuing anyway")
         except Exception as e:
-            print(f"Error navigating to URL: {e}")
+            logger.error("Error navigating to URL: %s", e)
         
+    # Runs all selectors, the visibility filter and attribute extraction in
+    # one browser call instead of several WebDriver round trips per element.
+    # A single comma-separated union query returns every match in document
+    # order with no duplicates, so no per-selector loop or seen-set needed.
+    _FIND_PDF_LINKS_JS = """
+    const out = [];
+    const matches = document.querySelectorAll(
+        "a[href$='.pdf'], a.pdf-icon, a img[src*='pdf'], " +
+        "a[href*='pdf'], img[src*='pdf'], a[onclick*='pdf']");
+    for (const e of matches) {
+        const r = e.getBoundingClientRect();
+        if (r.width === 0 || r.height === 0) continue;
+        // For <img> matches, the URL lives on the enclosing anchor
+        const a = e.tagName === 'A' ? e : e.closest('a');
+        out.push({
+            href: (a && a.href) || null,
+            onclick: (a && a.getAttribute('onclick')) || e.getAttribute('onclick'),
+            tag: e.tagName
+        });
+    }
+    return out;
+    """
+
     def find_pdf_links(self):
         """
-        Find all PDF links on the page using multiple selectors
-        
+        Find all visible PDF links on the page in a single browser call
+
         Returns:
-            list: List of WebElement objects representing PDF links
+            list: List of dicts with 'href', 'onclick' and 'tag' keys
         """
-        pdf_links = []
-        selectors = [
-            "a[href$='.pdf']",
-            "a.pdf-icon",
-            "a img[src*='pdf']",
-            "a[href*='pdf']",
-            "img[src*='pdf']",
-            "a[onclick*='pdf']"
-        ]
-        
-        print("Searching for PDF links...")
-        for selector in selectors:
-            try:
-                links = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if links:
-                    print(f"Found {len(links)} links with selector: {selector}")
-                    pdf_links.extend(links)
-            except Exception as e:
-                print(f"Error finding links with selector {selector}: {e}")
-        
-        # Also try XPath for more complex cases
+        logger.debug("Searching for PDF links...")
         try:
-            xpath_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, 'pdf') or contains(@onclick, 'pdf')]")
-            if xpath_links:
-                print(f"Found {len(xpath_links)} links with XPath")
-                # Add only unique elements
-                for link in xpath_links:
-                    if link not in pdf_links:
-                        pdf_links.append(link)
+            pdf_links = self.driver.execute_script(self._FIND_PDF_LINKS_JS)
         except Exception as e:
-            print(f"Error finding links with XPath: {e}")
-        
-        # Remove duplicates and clean the list
-        unique_links = []
-        for link in pdf_links:
-            if link.is_displayed() and link not in unique_links:
-                unique_links.append(link)
-        
-        print(f"Total unique PDF links found: {len(unique_links)}")
-        return unique_links
+            logger.error("Error finding PDF links: %s", e)
+            return []
+
+        logger.info("Total unique PDF links found: %d", len(pdf_links))
+        return pdf_links
     
-    def download_pdfs(self):
+    def extract_pdf_urls(self, pdf_links):
         """
-        Download PDF files directly
+        Extract PDF URLs from the found link records
+
+        Args:
+            pdf_links (list): List of dicts as returned by find_pdf_links
+
+        Returns:
+            list: List of PDF URL strings
         """
-        pdf_links = self.find_pdf_links()
-        
-        if not pdf_links:
-            print("No PDF links found on the page")
-            return
-        
-        print(f"Starting to download {len(pdf_links)} PDFs...")
-        
+        pdf_urls = []
         for i, link in enumerate(pdf_links):
-            try:
-                # Get the href attribute or onclick attribute that contains the PDF URL
-                pdf_url = None
-                
-                try:
-                    pdf_url = link.get_attribute('href')
-                except:
-                    pass
-                
-                if not pdf_url:
-                    try:
-                        onclick = link.get_attribute('onclick')
-                        if onclick and 'pdf' in onclick.lower():
-                            # Try to extract URL from onclick attribute
-                            import re
-                            match = re.search(r"window\.open\(['\"](.+?pdf)['\"]", onclick)
-                            if match:
-                                pdf_url = match.group(1)
-                    except:
-                        pass
-                
-                if not pdf_url and link.tag_name == 'img':
-                    # If the link is an image, try to get href from parent
-                    try:
-                        parent = self.driver.execute_script("return arguments[0].parentNode;", link)
-                        pdf_url = parent.get_attribute('href')
-                    except:
-                        pass
-                
-                if not pdf_url:
-                    print(f"Could not find PDF URL for link #{i+1}, skipping...")
-                    continue
-                
-                if not pdf_url.lower().endswith('.pdf') and 'pdf' not in pdf_url.lower():
-                    print(f"URL doesn't seem to be a PDF: {pdf_url}, skipping...")
-                    continue
-                
-                # Download the PDF
-                self.download_counter += 1
-                print(f"\nDownloading PDF #{self.download_counter} from: {pdf_url}")
-                
-                # Create a new tab for downloading
-                self.driver.execute_script("window.open('');")
-                self.driver.switch_to.window(self.driver.window_handles[-1])
-                
-                # Navigate to the PDF URL
-                self.driver.get(pdf_url)
-                
-                # Wait for the download to start
-                time.sleep(3)
-                
-                # Close the tab and go back to the main tab
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
-                
-                # Rename the file (check for the newest file in the download directory)
-                self.rename_latest_download(i)
-                
-                # Wait a bit before next download to avoid overwhelming the server
-                time.sleep(2)
-                
-            except StaleElementReferenceException:
-                print(f"Link #{i+1} is stale, skipping...")
+            # Get the href or the onclick attribute that contains the PDF URL
+            pdf_url = link.get('href')
+
+            if not pdf_url:
+                onclick = link.get('onclick')
+                if onclick and 'pdf' in onclick.lower():
+                    # Try to extract URL from onclick attribute
+                    match = _ONCLICK_PDF_RE.search(onclick)
+                    if match:
+                        pdf_url = match.group(1)
+
+            if not pdf_url:
+                logger.debug("Could not find PDF URL for link #%d, skipping...", i + 1)
                 continue
-            except Exception as e:
-                print(f"Error downloading PDF from link #{i+1}: {e}")
+
+            if not pdf_url.lower().endswith('.pdf') and 'pdf' not in pdf_url.lower():
+                logger.debug("URL doesn't seem to be a PDF: %s, skipping...", pdf_url)
                 continue
-    
-    def rename_latest_download(self, index):
+
+            pdf_urls.append(pdf_url)
+
+        return pdf_urls
+
+    def _sync_browser_cookies(self):
         """
-        Rename the latest downloaded file
-        
+        Copy the browser's session cookies onto the HTTP pool so
+        authenticated PDF downloads keep working
+        """
+        try:
+            cookies = self.driver.get_cookies()
+            if cookies:
+                cookie_header = "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+                self.http.headers['Cookie'] = cookie_header
+        except Exception as e:
+            logger.warning("Could not copy browser cookies: %s", e)
+
+    def _discover_links_static(self, url):
+        """
+        Find PDF links by fetching and parsing the page HTML directly,
+        without involving the browser
+
         Args:
-            index (int): Index of the PDF link
+            url (str): URL of the page to parse
+
+        Returns:
+            list: List of absolute PDF URL strings
         """
+        logger.info("Fetching %s for static link discovery...", url)
         try:
-            # Get all PDF files in the download directory
-            pdf_files = [f for f in os.listdir(self.download_folder) if f.endswith('.pdf') or f.endswith('.pdf.crdownload')]
-            
-            if not pdf_files:
-                print("No PDF files found in download directory")
+            if self._cached_session is not None:
+                response = self._cached_session.get(url)
+                status, data = response.status_code, response.content
+            else:
+                response = self.http.request('GET', url)
+                status, data = response.status, response.data
+            if status != 200:
+                logger.warning("Server returned status %s for %s", status, url)
+                return []
+            tree = lxml.html.fromstring(data)
+        except Exception as e:
+            logger.warning("Static link discovery failed: %s", e)
+            return []
+
+        hrefs = tree.xpath(
+            "//a[substring(@href, string-length(@href)-3)='.pdf'"
+            " or contains(@href,'pdf') or contains(@onclick,'pdf')]/@href"
+        )
+
+        pdf_urls = []
+        for href in hrefs:
+            absolute = urljoin(url, href)
+            if 'pdf' in absolute.lower():
+                pdf_urls.append(absolute)
+
+        logger.info("Found %d PDF links statically", len(pdf_urls))
+        return pdf_urls
+
+    def download_pdfs(self, url=None):
+        """
+        Download all PDF files linked from a page
+
+        Args:
+            url (str, optional): Page to scrape. When given, the page is
+                parsed statically first and the browser is only used as a
+                fallback for JavaScript-rendered pages. When omitted, the
+                browser's current page is scraped.
+        """
+        pdf_urls = []
+
+        if url:
+            pdf_urls = self._discover_links_static(url)
+            if not pdf_urls:
+                logger.info("Static parse found no links, falling back to the browser...")
+                self.navigate_to_url(url)
+
+        if not pdf_urls:
+            pdf_links = self.find_pdf_links()
+
+            if not pdf_links:
+                logger.warning("No PDF links found on the page")
                 return
-            
-            # Sort by modification time to get the most recent file
-            pdf_files.sort(key=lambda x: os.path.getmtime(os.path.join(self.download_folder, x)), reverse=True)
-            latest_file = pdf_files[0]
-            
-            # If the file is still being downloaded (.crdownload extension)
-            if latest_file.endswith('.crdownload'):
-                print("File is still downloading, waiting...")
-                for _ in range(30):  # Wait up to 30 seconds
-                    time.sleep(1)
-                    pdf_files = [f for f in os.listdir(self.download_folder) if f.endswith('.pdf') or f.endswith('.pdf.crdownload')]
-                    if pdf_files:
-                        pdf_files.sort(key=lambda x: os.path.getmtime(os.path.join(self.download_folder, x)), reverse=True)
-                        latest_file = pdf_files[0]
-                        if not latest_file.endswith('.crdownload'):
-                            break
-            
-            if latest_file.endswith('.crdownload'):
-                print("Download is taking too long, skipping renaming")
+
+            # Collect all URLs up front, then fetch them over the pooled connection
+            pdf_urls = self.extract_pdf_urls(pdf_links)
+
+            if not pdf_urls:
+                logger.warning("No usable PDF URLs found on the page")
                 return
-            
-            # Create a new filename with the counter prefix
-            new_filename = f"{self.download_counter:03d}-{latest_file}"
-            old_path = os.path.join(self.download_folder, latest_file)
-            new_path = os.path.join(self.download_folder, new_filename)
-            
-            # Try to rename the file
+
+            self._sync_browser_cookies()
+
+        # The same PDF can be reached through several selectors, so dedupe
+        # on the normalized absolute URL before downloading
+        base = url or self.driver.current_url
+        seen = set()
+        unique_urls = []
+        for pdf_url in pdf_urls:
+            canonical = _canonicalize_url(pdf_url, base)
+            if canonical not in seen:
+                seen.add(canonical)
+                unique_urls.append(canonical)
+        if len(unique_urls) < len(pdf_urls):
+            logger.debug("Skipping %d duplicate PDF URLs", len(pdf_urls) - len(unique_urls))
+        pdf_urls = unique_urls
+
+        self._preconnect(pdf_urls)
+
+        logger.info("Starting to download %d PDFs...", len(pdf_urls))
+
+        # Downloads are network-bound, so issue them concurrently over the
+        # shared connection pool; the index keeps the numbering click-order
+        # stable without sharing a counter across threads
+        with ThreadPoolExecutor(max_workers=12) as executor:
+            list(executor.map(self._download_one, enumerate(pdf_urls, start=1)))
+
+        self.download_counter = len(pdf_urls)
+        self._save_manifest()
+
+    def _preconnect(self, pdf_urls):
+        """
+        Warm one keep-alive connection per unique PDF host
+
+        DNS + TCP + TLS setup costs a few round trips per origin; doing it
+        before the download loop means the first real GET to each host
+        starts on an already-open socket.
+
+        Args:
+            pdf_urls (list): URLs about to be downloaded
+        """
+        hosts = {}
+        for pdf_url in pdf_urls:
+            parts = urlparse(pdf_url)
+            if parts.hostname:
+                hosts.setdefault((parts.hostname, parts.port), parts.scheme or 'https')
+
+        def warm(host, port, scheme):
             try:
-                os.rename(old_path, new_path)
-                print(f"Renamed to: {new_filename}")
-            except PermissionError:
-                print("File is being used by another process, waiting...")
-                time.sleep(5)
+                pool = self.http.connection_from_host(host, port=port, scheme=scheme)
+                pool.urlopen('HEAD', '/', retries=False)
+            except Exception:
+                # Warming is best-effort; the real GET reports any errors
+                pass
+
+        threads = [
+            threading.Thread(target=warm, args=(host, port, scheme), daemon=True)
+            for (host, port), scheme in hosts.items()
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+    def _load_manifest(self):
+        """
+        Load the download manifest from the download folder
+
+        Returns:
+            dict: Mapping of URL to {'etag', 'size', 'path'} for files
+                downloaded by previous runs
+        """
+        try:
+            with open(self._manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        """
+        Persist the download manifest to the download folder
+        """
+        try:
+            with open(self._manifest_path, 'w') as f:
+                json.dump(self._manifest, f, indent=2)
+        except OSError as e:
+            logger.warning("Could not save download manifest: %s", e)
+
+    def _download_one(self, indexed_url):
+        """
+        Stream a single PDF to the download folder
+
+        Args:
+            indexed_url (tuple): (index, pdf_url) pair identifying the download
+        """
+        index, pdf_url = indexed_url
+        try:
+            basename = os.path.basename(urlparse(pdf_url).path) or "document.pdf"
+            if not basename.lower().endswith('.pdf'):
+                basename += '.pdf'
+
+            filename = f"{index:03d}-{basename}"
+            file_path = self._dl + filename
+
+            # A HEAD over the same pooled connection tells us whether the
+            # copy from a previous run is already complete
+            entry = self._manifest.get(pdf_url, {})
+            local_path = entry.get('path', file_path)
+            local_size = os.path.getsize(local_path) if os.path.exists(local_path) else -1
+
+            if local_size >= 0:
+                try:
+                    head = self.http.request('HEAD', pdf_url)
+                    remote_size = int(head.headers.get('Content-Length', -1))
+                except (urllib3.exceptions.HTTPError, ValueError):
+                    remote_size = -1
+                if remote_size >= 0 and local_size == remote_size:
+                    logger.info("Already have %s, skipping", os.path.basename(local_path))
+                    return
+
+            headers = {}
+            if entry.get('etag') and local_size >= 0:
+                headers['If-None-Match'] = entry['etag']
+
+            logger.debug("Downloading PDF #%d from: %s", index, pdf_url)
+
+            response = self.http.request('GET', pdf_url, preload_content=False, headers=headers)
+            try:
+                if response.status == 304:
+                    logger.info("Unchanged on the server: %s, skipping", os.path.basename(local_path))
+                    return
+                if response.status != 200:
+                    logger.warning("Server returned status %s for %s", response.status, pdf_url)
+                    return
+
+                # Write to a temp file first so a failed download never
+                # leaves a half-written PDF under the final name
+                fd, temp_path = tempfile.mkstemp(dir=self.download_folder, suffix='.part')
                 try:
-                    os.rename(old_path, new_path)
-                    print(f"Renamed to: {new_filename}")
-                except Exception as e:
-                    print(f"Could not rename file after waiting: {e}")
-            except Exception as e:
-                print(f"Error renaming file: {e}")
-                
+                    # Copy in fixed 64 KB chunks; peak memory stays at
+                    # workers * buffer regardless of PDF size
+                    with os.fdopen(fd, 'wb') as f:
+                        shutil.copyfileobj(response, f, length=64 * 1024)
+                    os.replace(temp_path, file_path)
+                except BaseException:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                    raise
+            finally:
+                response.release_conn()
+
+            with self._manifest_lock:
+                self._manifest[pdf_url] = {
+                    'etag': response.headers.get('ETag'),
+                    'size': os.path.getsize(file_path),
+                    'path': file_path
+                }
+
+            logger.info("Saved: %s", filename)
         except Exception as e:
-            print(f"Error in rename_latest_download: {e}")
+            logger.error("Error downloading PDF from %s: %s", pdf_url, e)
     
     def close(self):
         """
-        Close the browser and clean up
+        Close the browser, if one was ever started, and clean up
         """
-        if self.driver:
-            self.driver.quit()
-            print("Browser closed")
+        if self._driver:
+            self._driver.quit()
+            self._driver = None
+            logger.info("Browser closed")
 
 
 def main():
+    # Per-link chatter lives at DEBUG; bump the level to see it
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Get the download folder path
     script_dir = os.path.dirname(os.path.abspath(__file__))
     download_folder = os.path.join(script_dir, "downloads")
@@ -292,19 +558,13 @@ def main():
     agent = PDFDownloaderAgent(download_folder)
     
     try:
-        # Navigate to the NIRF rankings page
-        agent.navigate_to_url("navigate-to-your-url") #Replace this with your desired URL
-        
-        # Wait for the page to load completely
-        time.sleep(5)
-        
-        # Download PDFs
-        agent.download_pdfs()
+        # Download PDFs from the NIRF rankings page
+        agent.download_pdfs("navigate-to-your-url") #Replace this with your desired URL
         
-        print("All PDFs downloaded successfully!")
+        logger.info("All PDFs downloaded successfully!")
     
     except Exception as e:
-        print(f"Error in main function: {e}")
+        logger.error("Error in main function: %s", e)
     
     finally:
         # Close the browser